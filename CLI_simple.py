@@ -9,29 +9,81 @@ Clean version with only the essential features:
 4. View analytics (4 essential functions)
 """
 
+import re
 import sys
-import os
+import importlib.util
 from datetime import datetime, date
-from typing import List, Dict, Optional, Any
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.prompt import Prompt, Confirm, IntPrompt
-from rich import box
-
-# Import backend services
+from typing import Optional
+
+# Backend services are imported on first use (see _load_backend) so that
+# trivial invocations like --help don't pay for the database driver import.
+# Rich is likewise imported where it is used rather than at module level.
+# find_spec locates backend.services without executing it, but it does import
+# the parent backend package, which fails if that package is missing.
+HabitService = HabitCompletionService = HabitAnalyticsService = UserService = None
+HabitPeriod = None
 try:
-    from backend.services import (
-        HabitService, HabitCompletionService, HabitAnalyticsService, 
-        UserService
-    )
-    from backend.models import Habit, HabitPeriod, HabitNotFoundException, DatabaseException
-    BACKEND_AVAILABLE = True
-except ImportError as e:
-    print(f"⚠️  Backend not available: {e}")
-    print("❌ Database backend is required for this application to function")
+    BACKEND_AVAILABLE = importlib.util.find_spec('backend.services') is not None
+except ModuleNotFoundError:
     BACKEND_AVAILABLE = False
 
+USAGE = """Usage: python CLI_simple.py [--help] [--no-pause]
+
+Interactive habit tracker. Run without arguments to open the main menu.
+
+Options:
+  -h, --help    Show this message and exit
+  --no-pause    Don't wait for Enter after each action
+                (the default when input is piped in)
+"""
+
+
+MENU_RULE = "=" * 50
+
+# Habits shown per page by list_habits
+PAGE_SIZE = 20
+
+# Zero-padded YYYY-MM-DD; anything else falls back to strptime
+_DATE_RE = re.compile(r'^(\d{4})-(\d{2})-(\d{2})$')
+
+# Valid main menu options; the menu itself lists them, so the prompt doesn't repeat them
+MAIN_MENU_CHOICES = frozenset({"1", "2", "3", "4", "5", "6", "7", "8"})
+
+
+def _load_backend() -> bool:
+    """Import the backend services once and cache them in module globals"""
+    global HabitService, HabitCompletionService, HabitAnalyticsService, UserService
+    global HabitPeriod, BACKEND_AVAILABLE
+    
+    if HabitService is not None:
+        return True
+    
+    try:
+        from backend.services import (
+            HabitService, HabitCompletionService, HabitAnalyticsService, 
+            UserService
+        )
+        from backend.models import HabitPeriod
+    except ImportError as e:
+        print(f"⚠️  Backend not available: {e}")
+        print("❌ Database backend is required for this application to function")
+        BACKEND_AVAILABLE = False
+    
+    return BACKEND_AVAILABLE
+
+
+# Services shared by every CLI instance in the process; see get_services
+_services = None
+
+
+def get_services():
+    """Return the (user, habit, completion, analytics) services, creating them once"""
+    global _services
+    
+    if _services is None:
+        _services = (UserService(), HabitService(), HabitCompletionService(), HabitAnalyticsService())
+    return _services
+
 
 class SimpleHabitTrackerCLI:
     """
@@ -39,54 +91,159 @@ class SimpleHabitTrackerCLI:
     Only includes essential functionality as specified in requirements
     """
     
-    def __init__(self):
+    def __init__(self, pause: Optional[bool] = None):
+        from rich.console import Console
         self.console = Console()
         self.running = True
+        # Only wait for Enter when someone is actually at the keyboard
+        self.pause = sys.stdin.isatty() if pause is None else pause
         
-        if BACKEND_AVAILABLE:
-            try:
-                self.user_service = UserService()
-                self.habit_service = HabitService()
-                self.completion_service = HabitCompletionService()
-                self.analytics_service = HabitAnalyticsService()
-                
-                # Ensure demo user exists
-                self.current_user = self.user_service.get_current_user()
-                
-            except Exception as e:
-                self.console.print(f"❌ Failed to initialize services: {e}")
-                sys.exit(1)
-        else:
-            sys.exit(1)
-
-    def show_header(self):
-        """Display application header"""
-        header = Panel(
+        # Header and menu content is static, so build the renderables only once
+        from rich.panel import Panel
+        from rich import box
+        self._header_panel = Panel(
             "🎯 Simple Habit Tracker\nTrack your daily and weekly habits",
             style="bold blue",
             box=box.ROUNDED
         )
-        self.console.print(header)
+        # render_str applies markup and highlighting once, as print() would each time
+        self._menu_text = self.console.render_str("\n".join([
+            "",
+            MENU_RULE,
+            "📋 MAIN MENU",
+            MENU_RULE,
+            "1. 🆕 Create New Habit",
+            "2. ✏️  Edit Habit",
+            "3. 🗑️  Delete Habit",
+            "4. ✅ Mark Habit Complete",
+            "5. 📊 View Analytics",
+            "6. 📋 List All Habits",
+            "7. 📅 View Completion History",
+            "8. ❌ Exit",
+            MENU_RULE,
+            "💡 Tip: Press Enter to list your habits (default option)",
+            "💡 Press Ctrl+C anytime to exit"
+        ]))
+        
+        # Main menu option -> handler
+        self._actions = {
+            "1": self.create_habit,
+            "2": self.edit_habit,
+            "3": self.delete_habit,
+            "4": self.mark_habit_complete,
+            "5": self.view_analytics,
+            "6": self.list_habits,
+            "7": self.view_completion_history,
+            "8": self._exit
+        }
+        
+        # Services are created by _require_backend() on the first menu
+        # action that needs them, so the menu shows up without waiting on the DB
+        self._backend_ready = False
+        
+        # Active habits, kept between menu actions and dropped whenever
+        # a habit is created, edited or deleted
+        self._habits_cache = None
+        
+        # Analytics results, dropped when completions or habits change.
+        # Streaks count back from today, so they are also dropped at midnight
+        self._dashboard_cache = None
+        self._streak_cache = {}
+        self._analytics_day = None
+        
+        # (today, earliest allowed completion date), recomputed when the day changes
+        self._date_bounds = None
+
+    def _require_backend(self):
+        """Import the backend and initialize services on first use"""
+        if self._backend_ready:
+            return
+        
+        if not _load_backend():
+            sys.exit(1)
+        
+        try:
+            (self.user_service, self.habit_service,
+             self.completion_service, self.analytics_service) = get_services()
+            
+            # Ensure demo user exists
+            self.current_user = self.user_service.get_current_user()
+            
+        except Exception as e:
+            self.console.print(f"❌ Failed to initialize services: {e}")
+            sys.exit(1)
+        
+        self._backend_ready = True
+
+    def _get_habits(self, force: bool = False):
+        """Return active habits, querying the database only when the cache is stale"""
+        if force or self._habits_cache is None:
+            self._habits_cache = self.habit_service.get_all_habits()
+        return self._habits_cache
+
+    def _invalidate_caches(self, habits: bool = True):
+        """Drop cached analytics, and the habit list unless only completions changed"""
+        if habits:
+            self._habits_cache = None
+        self._dashboard_cache = None
+        self._streak_cache = {}
+
+    def _check_analytics_day(self):
+        """Drop cached analytics computed on an earlier day"""
+        today = date.today()
+        if self._analytics_day != today:
+            self._invalidate_caches(habits=False)
+            self._analytics_day = today
+
+    def _get_dashboard(self):
+        """Return analytics dashboard data, reusing it until something changes"""
+        self._check_analytics_day()
+        if self._dashboard_cache is None:
+            self._dashboard_cache = self.analytics_service.get_dashboard(self._get_habits())
+            self._streak_cache.update(self._dashboard_cache['per_habit_streaks'])
+        return self._dashboard_cache
+
+    def _get_streak(self, habit) -> int:
+        """Return the current streak for a habit, computing it only when not cached"""
+        self._check_analytics_day()
+        if habit.habit_id not in self._streak_cache:
+            self._streak_cache.update(self.analytics_service.get_longest_run_streaks_for_habits([habit]))
+        return self._streak_cache[habit.habit_id]
+
+    def _get_date_bounds(self):
+        """Return (today, max_past) for validating completion dates"""
+        today = date.today()
+        if self._date_bounds is None or self._date_bounds[0] != today:
+            self._date_bounds = (today, today.replace(year=today.year - 1))
+        return self._date_bounds
+
+    def _read_menu_choice(self) -> str:
+        """Read a main menu option, asking again until it is valid (Enter lists habits)"""
+        # Same look as Prompt.ask with default="6", minus its per-call setup
+        while True:
+            choice = self.console.input("\n🎯 Choose an option [prompt.default](6)[/prompt.default]: ").strip() or "6"
+            if choice in MAIN_MENU_CHOICES:
+                return choice
+            self.console.print("[prompt.invalid.choice]Please select one of the available options")
+
+    def _pause(self):
+        """Wait for Enter before redrawing the menu (skipped with --no-pause)"""
+        if self.pause:
+            self.console.print("\n[dim]Press Enter to continue...[/dim]", end="")
+            sys.stdin.readline()
+
+    def show_header(self):
+        """Display application header"""
+        self.console.print(self._header_panel)
 
     def show_main_menu(self):
         """Display main menu with essential options only"""
-        self.console.print("\n" + "="*50)
-        self.console.print("📋 MAIN MENU")
-        self.console.print("="*50)
-        self.console.print("1. 🆕 Create New Habit")
-        self.console.print("2. ✏️  Edit Habit")
-        self.console.print("3. 🗑️  Delete Habit")
-        self.console.print("4. ✅ Mark Habit Complete")
-        self.console.print("5. 📊 View Analytics")
-        self.console.print("6. 📋 List All Habits")
-        self.console.print("7. 📅 View Completion History")
-        self.console.print("8. ❌ Exit")
-        self.console.print("="*50)
-        self.console.print("💡 Tip: Press Enter to list your habits (default option)")
-        self.console.print("💡 Press Ctrl+C anytime to exit")
+        self.console.print(self._menu_text)
 
     def create_habit(self):
         """Create a new habit"""
+        from rich.prompt import Prompt
+        
         self.console.print("\n🆕 CREATE NEW HABIT")
         self.console.print("-" * 30)
         
@@ -109,6 +266,7 @@ class SimpleHabitTrackerCLI:
             
             # Create the habit
             habit = self.habit_service.create_habit(habit_name, description, period_choice)
+            self._invalidate_caches()
             
             self.console.print(f"✅ Created habit: {habit.habit_name} ({habit.period.value})")
             
@@ -117,151 +275,251 @@ class SimpleHabitTrackerCLI:
 
     def list_habits(self):
         """List all active habits"""
+        habits = self._fetch_habits()
+        if habits:
+            self._page_habits(habits)
+        return habits
+
+    def _fetch_habits(self):
+        """Get active habits, reporting errors or an empty list to the user"""
         try:
-            habits = self.habit_service.get_all_habits()
-            
-            if not habits:
-                self.console.print("📭 No habits found. Create one first!")
-                return None
+            habits = self._get_habits()
+        except Exception as e:
+            self.console.print(f"❌ Error listing habits: {e}")
+            return None
+        
+        if not habits:
+            self.console.print("📭 No habits found. Create one first!")
+            return None
+        return habits
+
+    def _pick_habit(self, action: str):
+        """Show the habits and ask which one to act on; None if there are none or the user cancels"""
+        habits = self._fetch_habits()
+        if not habits:
+            return None
+        return self._page_habits(habits, action)
+
+    def _page_habits(self, habits, action: Optional[str] = None):
+        """
+        Show habits PAGE_SIZE rows at a time
+        
+        With an action, the habit the user picks is returned (None if they
+        cancel); without one, this only displays the list.
+        """
+        from rich.prompt import Prompt
+        from rich.table import Table
+        from rich import box
+        
+        # Only the current page is rendered; row numbers stay global so
+        # selection prompts can refer to any habit
+        offset = 0
+        while True:
+            page = habits[offset:offset + PAGE_SIZE]
+            title = "Your Habits"
+            if len(habits) > PAGE_SIZE:
+                title += f" ({offset + 1}-{offset + len(page)} of {len(habits)})"
             
-            table = Table(title="Your Habits", box=box.ROUNDED)
-            table.add_column("#", style="cyan", width=3)
+            table = Table(title=title, box=box.ROUNDED)
+            table.add_column("#", style="cyan", width=3, no_wrap=True)
             table.add_column("Habit Name", style="green", min_width=20)
-            table.add_column("Period", style="yellow", width=10)
-            table.add_column("Created", style="magenta", width=12)
+            table.add_column("Period", style="yellow", width=10, no_wrap=True)
+            table.add_column("Created", style="magenta", width=12, no_wrap=True)
             table.add_column("Description", style="blue", min_width=20)
             
-            for i, habit in enumerate(habits, 1):
-                # Format creation date
-                created_display = habit.created_date.strftime("%Y-%m-%d") if habit.created_date else "Unknown"
-                
+            for i, habit in enumerate(page, offset + 1):
                 table.add_row(
                     str(i),
                     habit.habit_name,
                     habit.period.value,
-                    created_display,
+                    habit.created_date_str,
                     habit.description or "No description"
                 )
             
             self.console.print(table)
-            return habits
             
-        except Exception as e:
-            self.console.print(f"❌ Error listing habits: {e}")
+            if len(habits) <= PAGE_SIZE:
+                return self._select_habit(habits, action) if action else None
+            
+            labels = {"p": r"\[p]rev", "n": r"\[n]ext", "b": r"\[b]ack to menu", "c": r"\[c]ancel"}
+            choices = []
+            if offset > 0:
+                choices.append("p")
+            if offset + PAGE_SIZE < len(habits):
+                choices.append("n")
+            choices.append("c" if action else "b")
+            
+            prompt = " / ".join(labels[c] for c in choices)
+            numbers = []
+            if action:
+                # Any habit number is accepted from any page
+                prompt = f"Enter habit number to {action}, or {prompt}"
+                numbers = [str(i) for i in range(1, len(habits) + 1)]
+            
+            choice = Prompt.ask(
+                prompt,
+                choices=choices + numbers,
+                default="n" if "n" in choices else choices[-1],
+                show_choices=False
+            )
+            if choice == "n":
+                offset += PAGE_SIZE
+            elif choice == "p":
+                offset -= PAGE_SIZE
+            elif choice in ("b", "c"):
+                return None
+            else:
+                return habits[int(choice) - 1]
+
+    def _select_habit(self, habits, action: str):
+        """Ask for a habit number (None on cancel); Rich re-prompts until it is valid"""
+        from rich.prompt import Prompt
+        
+        choice = Prompt.ask(
+            f"Enter habit number to {action}, or " + r"\[c]ancel",
+            choices=["c"] + [str(i) for i in range(1, len(habits) + 1)],
+            default="c",
+            show_choices=False
+        )
+        if choice == "c":
             return None
+        return habits[int(choice) - 1]
 
     def edit_habit(self):
         """Edit an existing habit"""
-        habits = self.list_habits()
-        if not habits:
+        from rich.prompt import Prompt
+        from rich.panel import Panel
+        from rich import box
+        
+        habit = self._pick_habit("edit")
+        if habit is None:
             return
             
         try:
-            choice = IntPrompt.ask("Enter habit number to edit", default=1)
+            # Edits are collected locally and saved with a single update
+            original = {
+                'name': habit.habit_name,
+                'description': habit.description or "",
+                'period': habit.period.value
+            }
+            fields = dict(original)
             
-            if 1 <= choice <= len(habits):
-                habit = habits[choice - 1]
-                
-                self.console.print(f"\n✏️ Editing: {habit.habit_name}")
-                
-                new_name = Prompt.ask("New name", default=habit.habit_name)
-                new_desc = Prompt.ask("New description", default=habit.description or "")
-                new_period = Prompt.ask("New period", choices=["daily", "weekly"], default=habit.period.value)
-                
-                updated_habit = self.habit_service.update_habit(
-                    habit.habit_id, new_name, new_desc, new_period
+            while True:
+                self.console.print(Panel(
+                    f"📝 Name: {fields['name']}\n"
+                    f"📄 Description: {fields['description'] or 'No description'}\n"
+                    f"⏰ Period: {fields['period']}",
+                    title=f"✏️ Editing: {habit.habit_name}",
+                    box=box.ROUNDED
+                ))
+                
+                action = Prompt.ask(
+                    r"\[n]ame / \[d]escription / \[p]eriod / \[s]ave / \[c]ancel",
+                    choices=["n", "d", "p", "s", "c"],
+                    default="s",
+                    show_choices=False
                 )
                 
-                self.console.print(f"✅ Updated habit: {updated_habit.habit_name}")
-            else:
-                self.console.print("❌ Invalid habit number")
+                if action == "n":
+                    fields['name'] = Prompt.ask("New name", default=fields['name'])
+                elif action == "d":
+                    fields['description'] = Prompt.ask("New description", default=fields['description'])
+                elif action == "p":
+                    fields['period'] = Prompt.ask("New period", choices=["daily", "weekly"], default=fields['period'])
+                elif action == "c":
+                    self.console.print("❌ Edit cancelled")
+                    return
+                else:
+                    break
+            
+            if fields == original:
+                self.console.print("ℹ️ No changes made")
+                return
+            
+            updated_habit = self.habit_service.update_habit(
+                habit.habit_id, fields['name'], fields['description'], fields['period']
+            )
+            self._invalidate_caches()
+            
+            self.console.print(f"✅ Updated habit: {updated_habit.habit_name}")
                 
         except Exception as e:
             self.console.print(f"❌ Error editing habit: {e}")
 
     def delete_habit(self):
         """Delete a habit"""
-        habits = self.list_habits()
-        if not habits:
+        from rich.prompt import Confirm
+        
+        habit = self._pick_habit("delete")
+        if habit is None:
             return
             
         try:
-            choice = IntPrompt.ask("Enter habit number to delete", default=1)
-            
-            if 1 <= choice <= len(habits):
-                habit = habits[choice - 1]
-                
-                confirm = Confirm.ask(f"Are you sure you want to delete '{habit.habit_name}'?")
-                if confirm:
-                    self.habit_service.delete_habit(habit.habit_id)
-                    self.console.print(f"✅ Deleted habit: {habit.habit_name}")
-                else:
-                    self.console.print("❌ Deletion cancelled")
+            confirm = Confirm.ask(f"Are you sure you want to delete '{habit.habit_name}'?")
+            if confirm:
+                self.habit_service.delete_habit(habit.habit_id)
+                self._invalidate_caches()
+                self.console.print(f"✅ Deleted habit: {habit.habit_name}")
             else:
-                self.console.print("❌ Invalid habit number")
+                self.console.print("❌ Deletion cancelled")
                 
         except Exception as e:
             self.console.print(f"❌ Error deleting habit: {e}")
 
     def mark_habit_complete(self):
         """Mark a habit as complete for any date"""
-        habits = self.list_habits()
-        if not habits:
+        from rich.prompt import Prompt
+        
+        habit = self._pick_habit("mark complete")
+        if habit is None:
             return
             
         try:
-            choice = IntPrompt.ask("Enter habit number to mark complete", default=1)
+            # Ask for the completion date
+            self.console.print("💡 Examples: 'today', '2025-08-01', '2025-07-30'")
+            date_input = Prompt.ask(
+                "📅 Date to mark complete (YYYY-MM-DD or 'today')", 
+                default="today"
+            )
             
-            if 1 <= choice <= len(habits):
-                habit = habits[choice - 1]
-                
-                # Ask for the completion date
-                self.console.print("💡 Examples: 'today', '2025-08-01', '2025-07-30'")
-                date_input = Prompt.ask(
-                    "📅 Date to mark complete (YYYY-MM-DD or 'today')", 
-                    default="today"
-                )
-                
-                # Parse the date
-                if date_input.lower() == "today":
-                    completion_date = date.today()
-                else:
-                    try:
+            # Parse the date
+            if date_input.lower() == "today":
+                completion_date = date.today()
+            else:
+                try:
+                    match = _DATE_RE.match(date_input)
+                    if match:
+                        completion_date = date(*map(int, match.groups()))
+                    else:
                         completion_date = datetime.strptime(date_input, "%Y-%m-%d").date()
-                        
-                        # Validate date range - no more than 1 year in the past, no future dates
-                        today = date.today()
-                        max_past = today.replace(year=today.year - 1)
-                        
-                        if completion_date < max_past:
-                            self.console.print(f"❌ Date too far in the past. Cannot mark habits complete before {max_past}")
-                            return
-                        elif completion_date > today:
-                            self.console.print(f"❌ Cannot mark habits complete for future dates. Please use today or an earlier date.")
-                            return
-                            
-                    except ValueError:
-                        self.console.print("❌ Invalid date format. Please use YYYY-MM-DD")
+                    
+                    # Validate date range - no more than 1 year in the past, no future dates
+                    today, max_past = self._get_date_bounds()
+                    
+                    if completion_date < max_past:
+                        self.console.print(f"❌ Date too far in the past. Cannot mark habits complete before {max_past}")
                         return
-                
-                # Check if already completed for this date
-                completion = self.completion_service.completion_dao.get_completion_by_habit_and_date(
-                    habit.habit_id, completion_date
-                )
-                if completion:
-                    self.console.print(f"✅ {habit.habit_name} is already completed on {completion_date}!")
+                    elif completion_date > today:
+                        self.console.print(f"❌ Cannot mark habits complete for future dates. Please use today or an earlier date.")
+                        return
+                        
+                except ValueError:
+                    self.console.print("❌ Invalid date format. Please use YYYY-MM-DD")
                     return
-                
-                notes = Prompt.ask("Add notes (optional)", default="")
-                
-                # Complete the habit for the specified date
-                completion = self.completion_service.complete_habit(
-                    habit.habit_id, completion_date=completion_date, notes=notes
-                )
-                self.console.print(f"✅ Marked '{habit.habit_name}' as complete for {completion_date}!")
-                
-            else:
-                self.console.print("❌ Invalid habit number")
+            
+            notes = Prompt.ask("Add notes (optional)", default="")
+            
+            # Complete the habit for the specified date; an existing completion
+            # is detected by the insert itself rather than a separate lookup
+            _, created = self.completion_service.complete_habit_if_new(
+                habit.habit_id, completion_date=completion_date, notes=notes
+            )
+            if not created:
+                self.console.print(f"✅ {habit.habit_name} is already completed on {completion_date}!")
+                return
+            
+            self._invalidate_caches(habits=False)
+            self.console.print(f"✅ Marked '{habit.habit_name}' as complete for {completion_date}!")
                 
         except Exception as e:
             self.console.print(f"❌ Error marking habit complete: {e}")
@@ -272,15 +530,18 @@ class SimpleHabitTrackerCLI:
         self.console.print("-" * 30)
         
         try:
+            # One backend call gathers everything shown below
+            dashboard = self._get_dashboard()
+            
             # 1. Currently tracked habits
-            tracked_habits = self.analytics_service.get_currently_tracked_habits()
+            tracked_habits = dashboard['tracked']
             self.console.print(f"📈 Currently tracked habits: {len(tracked_habits)}")
             for habit in tracked_habits:
                 self.console.print(f"  • {habit.habit_name} ({habit.period.value})")
             
             # 2. Habits by periodicity
-            daily_habits = self.analytics_service.get_habits_with_same_periodicity(HabitPeriod.DAILY)
-            weekly_habits = self.analytics_service.get_habits_with_same_periodicity(HabitPeriod.WEEKLY)
+            daily_habits = dashboard['daily']
+            weekly_habits = dashboard['weekly']
             
             self.console.print(f"\n📅 Daily habits: {len(daily_habits)}")
             for habit in daily_habits:
@@ -291,69 +552,70 @@ class SimpleHabitTrackerCLI:
                 self.console.print(f"  • {habit.habit_name}")
             
             # 3. Longest streak across all habits
-            longest_all = self.analytics_service.get_longest_run_streak_all_habits()
+            longest_all = dashboard['longest_all']
             if longest_all['habit']:
                 self.console.print(f"\n🏆 Best streak: {longest_all['habit_name']} - {longest_all['streak_length']} days")
             else:
                 self.console.print("\n🏆 No streaks yet - start completing habits!")
             
             # 4. Individual habit streaks
+            streaks = dashboard['per_habit_streaks']
             self.console.print(f"\n🔥 Individual habit streaks:")
             for habit in tracked_habits:
-                streak = self.analytics_service.get_longest_run_streak_for_habit(habit.habit_id)
-                self.console.print(f"  • {habit.habit_name}: {streak} days")
+                self.console.print(f"  • {habit.habit_name}: {streaks[habit.habit_id]} days")
                 
         except Exception as e:
             self.console.print(f"❌ Error getting analytics: {e}")
 
     def view_completion_history(self):
         """View completion history for a specific habit"""
-        habits = self.list_habits()
-        if not habits:
+        from rich.table import Table
+        from rich import box
+        
+        habit = self._pick_habit("view history")
+        if habit is None:
             return
             
         try:
-            choice = IntPrompt.ask("Enter habit number to view history", default=1)
+            self.console.print(f"\n📅 COMPLETION HISTORY: {habit.habit_name}")
+            self.console.print(f"Created: {habit.created_date_str}")
+            self.console.print("-" * 50)
             
-            if 1 <= choice <= len(habits):
-                habit = habits[choice - 1]
-                
-                self.console.print(f"\n📅 COMPLETION HISTORY: {habit.habit_name}")
-                self.console.print(f"Created: {habit.created_date.strftime('%Y-%m-%d') if habit.created_date else 'Unknown'}")
-                self.console.print("-" * 50)
-                
-                # Get completions for this habit
-                completions = self.completion_service.get_habit_completions(habit.habit_id, limit=20)
-                
-                if not completions:
-                    self.console.print("📭 No completions found for this habit yet.")
-                    return
-                
-                # Create completion history table
-                table = Table(title=f"Recent Completions ({len(completions)} shown)", box=box.ROUNDED)
-                table.add_column("Date", style="green", width=12)
-                table.add_column("Time", style="cyan", width=10)
-                table.add_column("Notes", style="blue", min_width=30)
-                
-                for completion in completions:
-                    completion_time = completion.created_at.strftime("%H:%M:%S") if completion.created_at else "Unknown"
-                    completion_date = completion.completion_date.strftime("%Y-%m-%d") if completion.completion_date else "Unknown"
-                    notes = completion.notes or "No notes"
-                    
-                    table.add_row(completion_date, completion_time, notes)
-                
-                self.console.print(table)
-                
-                # Show current streak
-                current_streak = self.analytics_service.get_longest_run_streak_for_habit(habit.habit_id)
-                self.console.print(f"\n🔥 Current streak: {current_streak} {'days' if habit.period.value == 'daily' else 'weeks'}")
+            # Get completions for this habit
+            completions = self.completion_service.get_habit_completions(habit.habit_id, limit=20)
+            
+            if not completions:
+                self.console.print("📭 No completions found for this habit yet.")
+                return
+            
+            # Create completion history table
+            table = Table(title=f"Recent Completions ({len(completions)} shown)", box=box.ROUNDED)
+            table.add_column("Date", style="green", width=12, no_wrap=True)
+            table.add_column("Time", style="cyan", width=10, no_wrap=True)
+            table.add_column("Notes", style="blue", min_width=30)
+            
+            for completion in completions:
+                completion_time = completion.created_at.strftime("%H:%M:%S") if completion.created_at else "Unknown"
+                completion_date = completion.completion_date_str
+                notes = completion.notes or "No notes"
                 
-            else:
-                self.console.print("❌ Invalid habit number")
+                table.add_row(completion_date, completion_time, notes)
+            
+            self.console.print(table)
+            
+            # Show current streak (cached alongside the analytics dashboard)
+            current_streak = self._get_streak(habit)
+            unit = 'days' if habit.period is HabitPeriod.DAILY else 'weeks'
+            self.console.print(f"\n🔥 Current streak: {current_streak} {unit}")
                 
         except Exception as e:
             self.console.print(f"❌ Error viewing completion history: {e}")
 
+    def _exit(self):
+        """Leave the main loop"""
+        self.console.print("👋 Goodbye!")
+        self.running = False
+
     def run(self):
         """Main application loop"""
         self.show_header()
@@ -362,34 +624,18 @@ class SimpleHabitTrackerCLI:
             try:
                 self.show_main_menu()
                 
-                choice = Prompt.ask(
-                    "\n🎯 Choose an option",
-                    choices=["1", "2", "3", "4", "5", "6", "7", "8"],
-                    default="6"
-                )
+                choice = self._read_menu_choice()
+                
+                if choice != "8":
+                    self._require_backend()
                 
-                if choice == "1":
-                    self.create_habit()
-                elif choice == "2":
-                    self.edit_habit()
-                elif choice == "3":
-                    self.delete_habit()
-                elif choice == "4":
-                    self.mark_habit_complete()
-                elif choice == "5":
-                    self.view_analytics()
-                elif choice == "6":
-                    self.list_habits()
-                elif choice == "7":
-                    self.view_completion_history()
-                elif choice == "8":
-                    self.console.print("👋 Goodbye!")
-                    self.running = False
+                self._actions[choice]()
                 
                 if self.running:
-                    Prompt.ask("\nPress Enter to continue...")
+                    self._pause()
                     
-            except KeyboardInterrupt:
+            except (KeyboardInterrupt, EOFError):
+                # Ctrl+C, or piped input ran out
                 self.console.print("\n👋 Goodbye!")
                 self.running = False
             except Exception as e:
@@ -398,11 +644,18 @@ class SimpleHabitTrackerCLI:
 
 def main():
     """Entry point for the application"""
+    args = sys.argv[1:]
+    
+    # Answer --help before touching the backend at all
+    if '--help' in args or '-h' in args:
+        print(USAGE)
+        sys.exit(0)
+    
     if not BACKEND_AVAILABLE:
         print("❌ Backend services are not available. Please check your setup.")
         sys.exit(1)
     
-    app = SimpleHabitTrackerCLI()
+    app = SimpleHabitTrackerCLI(pause=False if '--no-pause' in args else None)
     app.run()
 
 
@@ -9,9 +9,13 @@ This module provides the 4 essential pure functions for habit analysis:
 4. Return longest run streak for a given habit
 """
 from typing import List, Dict, Any, Optional
-from datetime import datetime, date, timedelta
+from datetime import date, timedelta
+from operator import attrgetter
 from backend.models import Habit, HabitCompletion, HabitPeriod
 
+# Shared step size, so streak checks don't construct a timedelta each call
+_ONE_DAY = timedelta(days=1)
+
 
 def get_currently_tracked_habits(habits: List[Habit]) -> List[Habit]:
     """
@@ -37,30 +41,53 @@ def get_habits_with_same_periodicity(habits: List[Habit], periodicity: HabitPeri
     Returns:
         List of habits with matching periodicity
     """
-    return [habit for habit in habits if habit.period == periodicity]
+    # HabitPeriod members are singletons, so an identity check is enough
+    return [habit for habit in habits if habit.period is periodicity]
 
 
-def get_longest_run_streak_all_habits(habits: List[Habit], completions_by_habit: Dict[int, List[HabitCompletion]]) -> Dict[str, Any]:
+def get_longest_run_streak_all_habits(habits: List[Habit], completions_by_habit: Dict[int, List[HabitCompletion]],
+                                      presorted: bool = False) -> Dict[str, Any]:
     """
     Pure function: Return longest run streak of all defined habits
     
     Args:
         habits: List of all habits
         completions_by_habit: Dictionary mapping habit_id to list of completions
+        presorted: True if each list is already ordered most recent first
+        
+    Returns:
+        Dictionary containing habit info and longest streak length
+    """
+    today = date.today()
+    streaks_by_habit = {
+        habit.habit_id: calculate_streak_length(
+            completions_by_habit.get(habit.habit_id, []), habit.period, today, presorted
+        )
+        for habit in habits
+    }
+    return select_longest_streak(habits, streaks_by_habit)
+
+
+def select_longest_streak(habits: List[Habit], streaks_by_habit: Dict[int, int]) -> Dict[str, Any]:
+    """
+    Pure function: Pick the habit with the longest streak from precomputed streaks
+    
+    Args:
+        habits: List of habits to choose from
+        streaks_by_habit: Dictionary mapping habit_id to its streak length
         
     Returns:
         Dictionary containing habit info and longest streak length
+        (habit is None when no habit has a streak)
     """
     longest_streak = 0
     best_habit = None
     
     for habit in habits:
-        habit_completions = completions_by_habit.get(habit.habit_id, [])
-        if habit_completions:
-            streak = calculate_streak_length(habit_completions, habit.period)
-            if streak > longest_streak:
-                longest_streak = streak
-                best_habit = habit
+        streak = streaks_by_habit.get(habit.habit_id, 0)
+        if streak > longest_streak:
+            longest_streak = streak
+            best_habit = habit
     
     return {
         'habit': best_habit,
@@ -69,27 +96,34 @@ def get_longest_run_streak_all_habits(habits: List[Habit], completions_by_habit:
     }
 
 
-def get_longest_run_streak_for_habit(habit: Habit, completions: List[HabitCompletion]) -> int:
+def get_longest_run_streak_for_habit(habit: Habit, completions: List[HabitCompletion],
+                                     today: Optional[date] = None, presorted: bool = False) -> int:
     """
     Pure function: Return longest run streak for a given habit
     
     Args:
         habit: The habit to analyze
         completions: List of completions for this habit
+        today: Date the streak is counted back from (defaults to date.today())
+        presorted: True if completions are already ordered most recent first
         
     Returns:
         Longest streak length for the given habit
     """
-    return calculate_streak_length(completions, habit.period)
+    return calculate_streak_length(completions, habit.period, today, presorted)
 
 
-def calculate_streak_length(completions: List[HabitCompletion], period: HabitPeriod) -> int:
+def calculate_streak_length(completions: List[HabitCompletion], period: HabitPeriod,
+                            today: Optional[date] = None, presorted: bool = False) -> int:
     """
     Pure function: Calculate the current streak length for a habit
     
     Args:
-        completions: List of habit completions sorted by date
+        completions: List of habit completions
         period: The habit period (DAILY or WEEKLY)
+        today: Date the streak is counted back from (defaults to date.today())
+        presorted: True if completions are already ordered most recent first,
+            as the DAO returns them, so they don't need sorting again
         
     Returns:
         Current streak length
@@ -97,16 +131,35 @@ def calculate_streak_length(completions: List[HabitCompletion], period: HabitPer
     if not completions:
         return 0
     
+    if today is None:
+        today = date.today()
+    daily = period is HabitPeriod.DAILY
+    
+    # A streak has to reach yesterday (daily) or this week (weekly); lapsed
+    # habits are settled from the latest date alone, without sorting
+    if presorted:
+        latest = completions[0].completion_date
+    else:
+        latest = max(completion.completion_date for completion in completions)
+    if daily:
+        if latest < today - _ONE_DAY:
+            return 0
+    elif latest < _get_week_start(today):
+        return 0
+    
     # Sort completions by date (most recent first)
-    sorted_completions = sorted(completions, key=lambda x: x.completion_date, reverse=True)
+    if presorted:
+        sorted_completions = completions
+    else:
+        sorted_completions = sorted(completions, key=attrgetter('completion_date'), reverse=True)
     
-    if period == HabitPeriod.DAILY:
-        return _calculate_daily_streak(sorted_completions)
+    if daily:
+        return _calculate_daily_streak(sorted_completions, today)
     else:  # WEEKLY
-        return _calculate_weekly_streak(sorted_completions)
+        return _calculate_weekly_streak(sorted_completions, today)
 
 
-def _calculate_daily_streak(sorted_completions: List[HabitCompletion]) -> int:
+def _calculate_daily_streak(sorted_completions: List[HabitCompletion], today: date) -> int:
     """
     Helper function: Calculate streak for daily habits
     """
@@ -114,25 +167,27 @@ def _calculate_daily_streak(sorted_completions: List[HabitCompletion]) -> int:
         return 0
     
     streak = 0
-    expected_date = date.today()
+    # Walk back in day ordinals (plain ints) rather than date - timedelta
+    expected_day = today.toordinal()
     
     # Check if completed today, if not, check yesterday
-    if sorted_completions[0].completion_date != expected_date:
-        expected_date = expected_date - timedelta(days=1)
-        if sorted_completions[0].completion_date != expected_date:
+    latest_day = sorted_completions[0].completion_date.toordinal()
+    if latest_day != expected_day:
+        expected_day -= 1
+        if latest_day != expected_day:
             return 0
     
     for completion in sorted_completions:
-        if completion.completion_date == expected_date:
+        if completion.completion_date.toordinal() == expected_day:
             streak += 1
-            expected_date -= timedelta(days=1)
+            expected_day -= 1
         else:
             break
     
     return streak
 
 
-def _calculate_weekly_streak(sorted_completions: List[HabitCompletion]) -> int:
+def _calculate_weekly_streak(sorted_completions: List[HabitCompletion], today: date) -> int:
     """
     Helper function: Calculate streak for weekly habits
     """
@@ -140,18 +195,19 @@ def _calculate_weekly_streak(sorted_completions: List[HabitCompletion]) -> int:
         return 0
     
     streak = 0
-    current_week_start = _get_week_start(date.today())
+    expected_week = _get_week_index(today)
     
-    completion_weeks = set()
+    # Completions are most recent first, so consecutive weeks can be checked
+    # in one pass that stops at the first missing week
     for completion in sorted_completions:
-        week_start = _get_week_start(completion.completion_date)
-        completion_weeks.add(week_start)
-    
-    # Check consecutive weeks backwards from current week
-    check_week = current_week_start
-    while check_week in completion_weeks:
+        week = _get_week_index(completion.completion_date)
+        if week > expected_week:
+            # Another completion in an already counted week (or a future one)
+            continue
+        if week < expected_week:
+            break
         streak += 1
-        check_week -= timedelta(weeks=1)
+        expected_week -= 1
     
     return streak
 
@@ -162,3 +218,11 @@ def _get_week_start(date_obj: date) -> date:
     """
     days_since_monday = date_obj.weekday()
     return date_obj - timedelta(days=days_since_monday)
+
+
+def _get_week_index(date_obj: date) -> int:
+    """
+    Helper function: Number the Monday-to-Sunday week containing a date
+    """
+    # Ordinal 1 (0001-01-01) is a Monday, so weeks split evenly on ordinal - 1
+    return (date_obj.toordinal() - 1) // 7
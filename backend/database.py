@@ -308,11 +308,48 @@ class HabitCompletionDAO(BaseDAO):
                 conn.rollback()
                 raise DatabaseException(f"Unexpected error during completion creation: {str(e)}")
     
+    def create_completion_if_absent(self, completion: HabitCompletion) -> Optional[int]:
+        """Create a habit completion unless one exists for that date; return the new ID or None"""
+        with self.get_db_connection() as conn:
+            cursor = conn.cursor()
+            try:
+                # The existence check and insert run as one statement, so a duplicate
+                # costs no extra round trip and simply produces no OUTPUT row
+                cursor.execute("""
+                    INSERT INTO HabitCompletions (HabitID, CompletionDate, Notes, CreatedAt)
+                    OUTPUT INSERTED.CompletionID
+                    SELECT ?, ?, ?, ?
+                    WHERE NOT EXISTS (
+                        SELECT 1 FROM HabitCompletions
+                        WHERE HabitID = ? AND CompletionDate = ?
+                    )
+                """, completion.habit_id, completion.completion_date,
+                   completion.notes, completion.created_at,
+                   completion.habit_id, completion.completion_date)
+                
+                result = cursor.fetchone()
+                conn.commit()
+                return int(result[0]) if result else None
+                
+            except pyodbc.IntegrityError as e:
+                conn.rollback()
+                # Lost a race with a concurrent insert of the same completion
+                if "UK_HabitCompletions_HabitDate" in str(e):
+                    return None
+                raise DatabaseException(f"Database integrity error: {str(e)}")
+            except pyodbc.Error as e:
+                conn.rollback()
+                raise DatabaseException(f"Database error during completion creation: {str(e)}")
+            except Exception as e:
+                conn.rollback()
+                raise DatabaseException(f"Unexpected error during completion creation: {str(e)}")
+    
     def get_completions_by_habit_id(self, habit_id: int, limit: Optional[int] = None) -> List[HabitCompletion]:
-        """Get completions for a specific habit"""
+        """Get completions for a specific habit, most recent first"""
         with self.get_db_connection() as conn:
             cursor = conn.cursor()
             
+            # Streak analytics rely on this ordering (presorted=True)
             if limit:
                 query = """
                     SELECT TOP (?) CompletionID, HabitID, CompletionDate, Notes, CreatedAt
@@ -330,16 +367,43 @@ class HabitCompletionDAO(BaseDAO):
                 """
                 cursor.execute(query, (habit_id,))
             
-            completions = []
-            for row in cursor.fetchall():
-                completions.append(HabitCompletion(
-                    completion_id=row[0],
-                    habit_id=row[1],
-                    completion_date=row[2],
-                    notes=row[3],
-                    created_at=row[4]
+            return [
+                HabitCompletion(
+                    completion_id=completion_id,
+                    habit_id=row_habit_id,
+                    completion_date=completion_date,
+                    notes=notes,
+                    created_at=created_at
+                )
+                for completion_id, row_habit_id, completion_date, notes, created_at in cursor.fetchall()
+            ]
+    
+    def get_completions_by_habit_ids(self, habit_ids: List[int]) -> Dict[int, List[HabitCompletion]]:
+        """Get completions for several habits in a single query, grouped by habit ID"""
+        completions_by_habit = {habit_id: [] for habit_id in habit_ids}
+        if not completions_by_habit:
+            return completions_by_habit
+        
+        with self.get_db_connection() as conn:
+            cursor = conn.cursor()
+            placeholders = ", ".join("?" * len(completions_by_habit))
+            # Most recent first within each habit; streak analytics rely on this
+            cursor.execute(f"""
+                SELECT CompletionID, HabitID, CompletionDate, Notes, CreatedAt
+                FROM HabitCompletions 
+                WHERE HabitID IN ({placeholders})
+                ORDER BY HabitID, CompletionDate DESC
+            """, list(completions_by_habit))
+            
+            for completion_id, row_habit_id, completion_date, notes, created_at in cursor.fetchall():
+                completions_by_habit[row_habit_id].append(HabitCompletion(
+                    completion_id=completion_id,
+                    habit_id=row_habit_id,
+                    completion_date=completion_date,
+                    notes=notes,
+                    created_at=created_at
                 ))
-            return completions
+            return completions_by_habit
     
     def get_completion_by_habit_and_date(self, habit_id: int, completion_date: date) -> Optional[HabitCompletion]:
         """Get completion for a specific habit and date"""
@@ -3,11 +3,19 @@ Models module for Habit Tracker Application
 Following Object-Oriented programming paradigm as required
 """
 from datetime import datetime, date
-from typing import List, Optional, Dict, Any #why is list dict and any not used?
+from typing import Optional
 from dataclasses import dataclass
+from functools import cached_property
 from enum import Enum
 
 
+def format_date(value: Optional[date]) -> str:
+    """Format a date as YYYY-MM-DD without going through strftime ("Unknown" if missing)"""
+    if not value:
+        return "Unknown"
+    return f"{value.year}-{value.month:02}-{value.day:02}"
+
+
 class HabitPeriod(Enum):
     """Enumeration for habit periods"""
     DAILY = "daily"
@@ -51,6 +59,16 @@ class Habit: #does it matter if the variables are a bit different than in databa
     def __str__(self) -> str:
         return f"{self.habit_name} ({self.period.value})"
 
+    @cached_property
+    def created_date_str(self) -> str:
+        """
+        Creation date as YYYY-MM-DD, formatted once per instance
+        
+        The value is cached on first access, so it goes stale if created_date
+        is reassigned afterwards on this (mutable) instance.
+        """
+        return format_date(self.created_date)
+
 
 @dataclass
 class HabitCompletion:
@@ -67,6 +85,11 @@ class HabitCompletion:
         if self.created_at is None:
             self.created_at = datetime.now()
 
+    @property
+    def completion_date_str(self) -> str:
+        """Completion date as YYYY-MM-DD"""
+        return format_date(self.completion_date)
+
 
 @dataclass
 class UserSetting:
@@ -110,27 +110,40 @@ class HabitCompletionService:
         self.completion_dao = HabitCompletionDAO()
         self.habit_service = HabitService()
     
-    def complete_habit(self, habit_id: int, completion_date: date = None, notes: str = "") -> HabitCompletion:
-        """Mark a habit as completed for a specific date"""
-        habit = self.habit_service.get_habit_by_id(habit_id)  # Verify habit exists
+    def _new_completion(self, habit_id: int, completion_date: Optional[date], notes: str) -> HabitCompletion:
+        """Verify the habit exists and build an unsaved completion for it"""
+        self.habit_service.get_habit_by_id(habit_id)  # Verify habit exists
         
         if completion_date is None:
             completion_date = date.today()
         
-        completion = HabitCompletion(
+        return HabitCompletion(
             habit_id=habit_id,
             completion_date=completion_date,
             notes=notes
         )
-        
-        completion_id = self.completion_dao.create_completion(completion)
-        completion.completion_id = completion_id
+    
+    def complete_habit(self, habit_id: int, completion_date: date = None, notes: str = "") -> HabitCompletion:
+        """Mark a habit as completed for a specific date"""
+        completion = self._new_completion(habit_id, completion_date, notes)
+        completion.completion_id = self.completion_dao.create_completion(completion)
         return completion
     
+    def complete_habit_if_new(self, habit_id: int, completion_date: date = None,
+                              notes: str = "") -> Tuple[HabitCompletion, bool]:
+        """Mark a habit as completed unless it already is; return (completion, created)"""
+        completion = self._new_completion(habit_id, completion_date, notes)
+        completion.completion_id = self.completion_dao.create_completion_if_absent(completion)
+        return completion, completion.completion_id is not None
+    
     def get_habit_completions(self, habit_id: int, limit: int = None) -> List[HabitCompletion]:
         """Get completions for a specific habit"""
         return self.completion_dao.get_completions_by_habit_id(habit_id, limit)
     
+    def get_completions_for_habits(self, habit_ids: List[int]) -> Dict[int, List[HabitCompletion]]:
+        """Get completions for several habits with one database round trip"""
+        return self.completion_dao.get_completions_by_habit_ids(habit_ids)
+    
     def is_habit_completed_today(self, habit_id: int) -> bool:
         """Check if a habit is completed today"""
         completion = self.completion_dao.get_completion_by_habit_and_date(
@@ -147,33 +160,70 @@ class HabitAnalyticsService:
         self.completion_service = HabitCompletionService()
         self.user_service = UserService()
     
-    def get_currently_tracked_habits(self) -> List[Habit]:
+    def get_currently_tracked_habits(self, habits: Optional[List[Habit]] = None) -> List[Habit]:
         """Get list of currently tracked habits"""
         from backend.analytics import get_currently_tracked_habits
-        habits = self.habit_service.get_all_habits()
+        if habits is None:
+            habits = self.habit_service.get_all_habits()
         return get_currently_tracked_habits(habits)
     
-    def get_habits_with_same_periodicity(self, periodicity: HabitPeriod) -> List[Habit]:
+    def get_habits_with_same_periodicity(self, periodicity: HabitPeriod,
+                                         habits: Optional[List[Habit]] = None) -> List[Habit]:
         """Get list of habits with same periodicity"""
         from backend.analytics import get_habits_with_same_periodicity
-        habits = self.habit_service.get_all_habits()
+        if habits is None:
+            habits = self.habit_service.get_all_habits()
         return get_habits_with_same_periodicity(habits, periodicity)
     
-    def get_longest_run_streak_all_habits(self) -> Dict[str, Any]:
+    def get_longest_run_streak_all_habits(self, habits: Optional[List[Habit]] = None) -> Dict[str, Any]:
         """Get longest run streak of all defined habits"""
         from backend.analytics import get_longest_run_streak_all_habits
-        habits = self.habit_service.get_all_habits()
+        if habits is None:
+            habits = self.habit_service.get_all_habits()
+        
+        # Get completions for all habits in one query instead of one per habit
+        completions_by_habit = self.completion_service.get_completions_for_habits(
+            [habit.habit_id for habit in habits]
+        )
+        
+        return get_longest_run_streak_all_habits(habits, completions_by_habit, presorted=True)
+    
+    def get_longest_run_streaks_for_habits(self, habits: Optional[List[Habit]] = None) -> Dict[int, int]:
+        """Get longest run streak for several habits, fetching all completions in one query"""
+        from backend.analytics import get_longest_run_streak_for_habit
+        if habits is None:
+            habits = self.habit_service.get_all_habits()
+        
+        completions_by_habit = self.completion_service.get_completions_for_habits(
+            [habit.habit_id for habit in habits]
+        )
+        today = date.today()
+        
+        return {
+            habit.habit_id: get_longest_run_streak_for_habit(
+                habit, completions_by_habit.get(habit.habit_id, []), today, presorted=True
+            )
+            for habit in habits
+        }
+    
+    def get_dashboard(self, habits: Optional[List[Habit]] = None) -> Dict[str, Any]:
+        """Get all analytics shown on the dashboard from a single completions query"""
+        from backend.analytics import select_longest_streak
         
-        # Get completions for all habits
-        completions_by_habit = {}
-        for habit in habits:
-            completions_by_habit[habit.habit_id] = self.completion_service.get_habit_completions(habit.habit_id)
+        tracked = self.get_currently_tracked_habits(habits)
+        per_habit_streaks = self.get_longest_run_streaks_for_habits(tracked)
         
-        return get_longest_run_streak_all_habits(habits, completions_by_habit)
+        return {
+            'tracked': tracked,
+            'daily': self.get_habits_with_same_periodicity(HabitPeriod.DAILY, tracked),
+            'weekly': self.get_habits_with_same_periodicity(HabitPeriod.WEEKLY, tracked),
+            'longest_all': select_longest_streak(tracked, per_habit_streaks),
+            'per_habit_streaks': per_habit_streaks
+        }
     
     def get_longest_run_streak_for_habit(self, habit_id: int) -> int:
         """Get longest run streak for a given habit"""
         from backend.analytics import get_longest_run_streak_for_habit
         habit = self.habit_service.get_habit_by_id(habit_id)
         completions = self.completion_service.get_habit_completions(habit_id)
-        return get_longest_run_streak_for_habit(habit, completions)
+        return get_longest_run_streak_for_habit(habit, completions, presorted=True)
@@ -21,7 +21,8 @@ from backend.analytics import (
     get_habits_with_same_periodicity,
     get_longest_run_streak_all_habits,
     get_longest_run_streak_for_habit,
-    calculate_streak_length
+    calculate_streak_length,
+    select_longest_streak
 )
 
 
@@ -52,6 +53,15 @@ class TestHabitModels(unittest.TestCase):
         
         self.assertEqual(habit.period, HabitPeriod.DAILY)
     
+    def test_habit_created_date_str(self):
+        """Test the formatted creation date shown in habit listings"""
+        habit = Habit(habit_name="Dated Habit", created_date=date(2025, 8, 1))
+        
+        self.assertEqual(habit.created_date_str, "2025-08-01")
+        
+        completion = HabitCompletion(habit_id=1, completion_date=date(2025, 8, 2))
+        self.assertEqual(completion.completion_date_str, "2025-08-02")
+    
     def test_habit_completion_creation(self):
         """Test creating a habit completion"""
         completion = HabitCompletion(
@@ -153,6 +163,16 @@ class TestAnalyticsFunctions(unittest.TestCase):
         self.assertIsInstance(result, int)
         self.assertGreater(result, 0)
     
+    def test_select_longest_streak(self):
+        """Test picking the best habit from precomputed streaks"""
+        best = select_longest_streak(self.habits, {1: 2, 2: 5, 3: 5})
+        self.assertEqual(best['habit'], self.habits[1])
+        self.assertEqual(best['streak_length'], 5)
+        
+        none = select_longest_streak(self.habits, {1: 0})
+        self.assertIsNone(none['habit'])
+        self.assertEqual(none['streak_length'], 0)
+    
     def test_calculate_streak_length_empty_completions(self):
         """Test streak calculation with no completions"""
         result = calculate_streak_length([], HabitPeriod.DAILY)
@@ -172,6 +192,49 @@ class TestAnalyticsFunctions(unittest.TestCase):
         result = calculate_streak_length(weekly_completions, HabitPeriod.WEEKLY)
         self.assertIsInstance(result, int)
         self.assertGreaterEqual(result, 0)
+    
+    def test_calculate_streak_length_from_given_day(self):
+        """Test that streaks are counted back from the day passed in"""
+        day = date(2025, 8, 6)  # a Wednesday
+        completions = [
+            HabitCompletion(habit_id=1, completion_date=day - timedelta(days=offset))
+            for offset in (0, 1, 2, 7, 14)
+        ]
+        
+        self.assertEqual(calculate_streak_length(completions, HabitPeriod.DAILY, day), 3)
+        self.assertEqual(calculate_streak_length(completions, HabitPeriod.DAILY, day + timedelta(days=1)), 3)
+        self.assertEqual(calculate_streak_length(completions, HabitPeriod.DAILY, day + timedelta(days=2)), 0)
+        self.assertEqual(calculate_streak_length(completions, HabitPeriod.WEEKLY, day), 3)
+        self.assertEqual(calculate_streak_length(completions, HabitPeriod.WEEKLY, day + timedelta(days=7)), 0)
+    
+    def test_presorted_completions_match_sorted_path(self):
+        """Test that DAO-ordered (most recent first) completions give the same streaks with presorted=True"""
+        day = date(2025, 8, 6)  # a Wednesday
+        dao_ordered = [
+            HabitCompletion(habit_id=1, completion_date=day - timedelta(days=offset))
+            for offset in (0, 1, 2, 3, 5, 7, 8, 14, 21, 35)
+        ]
+        oldest_first = dao_ordered[::-1]
+        
+        for period in (HabitPeriod.DAILY, HabitPeriod.WEEKLY):
+            for today in (day, day + timedelta(days=1), day + timedelta(days=4)):
+                expected = calculate_streak_length(oldest_first, period, today)
+                self.assertEqual(calculate_streak_length(dao_ordered, period, today), expected)
+                self.assertEqual(calculate_streak_length(dao_ordered, period, today, presorted=True), expected)
+        
+        # Same check through the all-habits function, which counts from date.today()
+        today = date.today()
+        completions_by_habit = {
+            habit.habit_id: [
+                HabitCompletion(habit_id=habit.habit_id, completion_date=today - timedelta(days=offset))
+                for offset in (0, 1, 2, 4, 7, 14)
+            ]
+            for habit in self.habits
+        }
+        self.assertEqual(
+            get_longest_run_streak_all_habits(self.habits, completions_by_habit, presorted=True),
+            get_longest_run_streak_all_habits(self.habits, completions_by_habit)
+        )
 
 
 class TestHabitServices(unittest.TestCase):
@@ -204,6 +267,107 @@ class TestHabitServices(unittest.TestCase):
         service = HabitAnalyticsService()
         self.assertIsNotNone(service)
 
+    @patch('backend.services.HabitService')
+    @patch('backend.services.HabitCompletionService')
+    @patch('backend.services.UserService')
+    def test_longest_streak_all_habits_uses_bulk_fetch(self, mock_user_service, mock_completion_service, mock_habit_service):
+        """Test that completions for all habits are fetched in a single call"""
+        from backend.services import HabitAnalyticsService
+
+        habits = [
+            Habit(habit_id=1, habit_name="Habit 1", period=HabitPeriod.DAILY),
+            Habit(habit_id=2, habit_name="Habit 2", period=HabitPeriod.DAILY)
+        ]
+        mock_habit_service.return_value.get_all_habits.return_value = habits
+        mock_completion_service.return_value.get_completions_for_habits.return_value = {
+            1: [HabitCompletion(habit_id=1, completion_date=date.today())],
+            2: []
+        }
+
+        service = HabitAnalyticsService()
+        result = service.get_longest_run_streak_all_habits()
+
+        mock_completion_service.return_value.get_completions_for_habits.assert_called_once_with([1, 2])
+        mock_completion_service.return_value.get_habit_completions.assert_not_called()
+        self.assertEqual(result['habit_name'], "Habit 1")
+        self.assertEqual(result['streak_length'], 1)
+
+    @patch('backend.services.HabitService')
+    @patch('backend.services.HabitCompletionService')
+    @patch('backend.services.UserService')
+    def test_analytics_reuse_prefetched_habits(self, mock_user_service, mock_completion_service, mock_habit_service):
+        """Test that analytics methods skip the habit query when given a habit list"""
+        from backend.services import HabitAnalyticsService
+
+        habits = [
+            Habit(habit_id=1, habit_name="Daily", period=HabitPeriod.DAILY),
+            Habit(habit_id=2, habit_name="Weekly", period=HabitPeriod.WEEKLY)
+        ]
+
+        service = HabitAnalyticsService()
+        tracked = service.get_currently_tracked_habits(habits)
+        daily = service.get_habits_with_same_periodicity(HabitPeriod.DAILY, tracked)
+
+        mock_habit_service.return_value.get_all_habits.assert_not_called()
+        self.assertEqual(len(tracked), 2)
+        self.assertEqual([h.habit_name for h in daily], ["Daily"])
+
+    @patch('backend.services.HabitService')
+    @patch('backend.services.HabitCompletionService')
+    @patch('backend.services.UserService')
+    def test_longest_run_streaks_for_habits(self, mock_user_service, mock_completion_service, mock_habit_service):
+        """Test that per-habit streaks are computed from a single bulk fetch"""
+        from backend.services import HabitAnalyticsService
+
+        today = date.today()
+        habits = [
+            Habit(habit_id=1, habit_name="Daily", period=HabitPeriod.DAILY),
+            Habit(habit_id=2, habit_name="Weekly", period=HabitPeriod.WEEKLY)
+        ]
+        mock_completion_service.return_value.get_completions_for_habits.return_value = {
+            1: [HabitCompletion(habit_id=1, completion_date=today),
+                HabitCompletion(habit_id=1, completion_date=today - timedelta(days=1))],
+            2: []
+        }
+
+        service = HabitAnalyticsService()
+        streaks = service.get_longest_run_streaks_for_habits(habits)
+
+        self.assertEqual(streaks, {1: 2, 2: 0})
+        mock_completion_service.return_value.get_completions_for_habits.assert_called_once_with([1, 2])
+        mock_completion_service.return_value.get_habit_completions.assert_not_called()
+
+    @patch('backend.services.HabitService')
+    @patch('backend.services.HabitCompletionService')
+    @patch('backend.services.UserService')
+    def test_dashboard_uses_single_fetch(self, mock_user_service, mock_completion_service, mock_habit_service):
+        """Test that the dashboard gathers all analytics from one completions query"""
+        from backend.services import HabitAnalyticsService
+
+        today = date.today()
+        habits = [
+            Habit(habit_id=1, habit_name="Daily", period=HabitPeriod.DAILY),
+            Habit(habit_id=2, habit_name="Weekly", period=HabitPeriod.WEEKLY),
+            Habit(habit_id=3, habit_name="Paused", period=HabitPeriod.DAILY, is_active=False)
+        ]
+        mock_completion_service.return_value.get_completions_for_habits.return_value = {
+            1: [HabitCompletion(habit_id=1, completion_date=today),
+                HabitCompletion(habit_id=1, completion_date=today - timedelta(days=1))],
+            2: []
+        }
+
+        service = HabitAnalyticsService()
+        dashboard = service.get_dashboard(habits)
+
+        self.assertEqual([h.habit_id for h in dashboard['tracked']], [1, 2])
+        self.assertEqual([h.habit_id for h in dashboard['daily']], [1])
+        self.assertEqual([h.habit_id for h in dashboard['weekly']], [2])
+        self.assertEqual(dashboard['longest_all']['habit_name'], "Daily")
+        self.assertEqual(dashboard['longest_all']['streak_length'], 2)
+        self.assertEqual(dashboard['per_habit_streaks'], {1: 2, 2: 0})
+        mock_completion_service.return_value.get_completions_for_habits.assert_called_once_with([1, 2])
+        mock_habit_service.return_value.get_all_habits.assert_not_called()
+
 
 class TestFunctionalRequirements(unittest.TestCase):
     """Test cases for the specific functional requirements mentioned"""
@@ -343,6 +507,28 @@ class TestTaskCompletionRequirement(unittest.TestCase):
         completion_future = service.complete_habit(habit_id=1, completion_date=tomorrow)
         self.assertEqual(completion_future.completion_date, tomorrow)
     
+    @patch('backend.services.HabitCompletionDAO')
+    @patch('backend.services.HabitService')
+    def test_complete_habit_if_new(self, mock_habit_service, mock_completion_dao):
+        """Test that completing an already completed habit is reported, not duplicated"""
+        from backend.services import HabitCompletionService
+        
+        mock_habit = Habit(habit_id=1, habit_name="Test Habit", period=HabitPeriod.DAILY)
+        mock_habit_service.return_value.get_habit_by_id.return_value = mock_habit
+        mock_completion_dao.return_value.create_completion_if_absent.side_effect = [123, None]
+        
+        service = HabitCompletionService()
+        
+        completion, created = service.complete_habit_if_new(habit_id=1, notes="First")
+        self.assertTrue(created)
+        self.assertEqual(completion.completion_id, 123)
+        self.assertEqual(completion.completion_date, date.today())
+        
+        completion, created = service.complete_habit_if_new(habit_id=1, notes="Again")
+        self.assertFalse(created)
+        self.assertIsNone(completion.completion_id)
+        mock_completion_dao.return_value.get_completion_by_habit_and_date.assert_not_called()
+    
     @patch('backend.services.HabitCompletionDAO')
     @patch('backend.services.HabitService')
     def test_is_habit_completed_today(self, mock_habit_service, mock_completion_dao):